@@ -1,21 +1,86 @@
 import os
+import re
+import atexit
+import queue
+import logging
 import sys
 import signal
-import smtplib
 import traceback
 import socket
-import socks
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import threading
+import time
 from datetime import datetime
 from types import FrameType
-from typing import Optional, Any
+from typing import Optional, Any, Dict, Tuple
+
+# scheme://[user[:password]@]host[:port], where host may be a bracketed IPv6 literal
+_PROXY_RE = re.compile(r'^[A-Za-z][A-Za-z0-9+.-]*://(?:[^@/?#]*@)?(?:\[([^\]]+)\]|([^:/?#\[\]]+))(?::(\d+))?(?:[/?#]|$)')
+
+class _FallbackHandler(logging.StreamHandler):
+    """
+    Prints with the familiar prefix only while the host application has not configured logging itself.
+    """
+    def emit(self, record: logging.LogRecord):
+        if not logging.getLogger().handlers:
+            super().emit(record)
+
+def _defer_to_root_level(record: logging.LogRecord) -> bool:
+    """
+    Logger filter that applies the root level once the host application has configured logging,
+    so the INFO level set for the fallback does not outlive it.
+    """
+    root = logging.getLogger()
+    return not root.handlers or record.levelno >= root.level
+
+_log = logging.getLogger("termination_monitor")
+# Plain scripts keep seeing the messages on stdout; applications with their own logging setup get them via propagation
+if not logging.getLogger().handlers:
+    _log_handler = _FallbackHandler(sys.stdout)
+    _log_handler.setFormatter(logging.Formatter("[TERMINATION_MONITOR] %(message)s"))
+    _log.addHandler(_log_handler)
+    _log.setLevel(logging.INFO)
+    _log.addFilter(_defer_to_root_level)
+
+# Idle pooled sessions are poked with NOOP this often, and closed once unused for longer than the timeout
+_KEEPALIVE_INTERVAL = 60
+_POOL_IDLE_TIMEOUT = 100
+
+# Default bound, in seconds, on each blocking SMTP operation
+_SMTP_TIMEOUT = 30
+
+# Seconds to wait for queued alerts to go out after a crash, and at interpreter exit. The crash wait
+# is kept short because it only matters to a caller that catches the exception and carries on; a
+# healthy server is done well within it. Against a slow or dead server it gives up with the alerts
+# still pending, and if the process then ends, the exit hook waits for them again. The exit wait
+# covers the start-up email and the report each hitting the SMTP timeout.
+_CRASH_FLUSH_TIMEOUT = 3
+_EXIT_FLUSH_TIMEOUT = 2 * _SMTP_TIMEOUT + 5
+
+# Email bodies, filled in with str.format_map when sent
+_STARTUP_TEMPLATE = (
+    "Program monitoring has started successfully.\n\n"
+    "Host Machine: {hostname}\n"
+    "Start Time: {start_time}\n"
+    "----------------------------------------\n"
+    "You will receive another email when the program terminates (success or failure).\n"
+)
+_REPORT_TEMPLATE = (
+    "Your program monitoring report:\n\n"
+    "Host Machine: {hostname}\n"
+    "Status: {status}\n"
+    "Time: {time}\n"
+    "----------------------------------------\n"
+    "Error Logs / Traceback:\n"
+    "{details}\n"
+    "----------------------------------------\n"
+    "This is an automated message from Your_Program_is_Terminated library."
+)
 
 class SimpleEmailServer:
     """
     A simple wrapper client to handle SMTP connections and sending emails.
     """
-    def __init__(self, smtp_host: str, smtp_port: int, sender_email: str, sender_password: str, http_proxy: str = None, https_proxy: str = None, socks_proxy: str = None):
+    def __init__(self, smtp_host: str, smtp_port: int, sender_email: str, sender_password: str, http_proxy: str = None, https_proxy: str = None, socks_proxy: str = None, timeout: float = _SMTP_TIMEOUT):
         self.smtp_host = smtp_host
         self.smtp_port = smtp_port
         self.sender_email = sender_email
@@ -23,7 +88,21 @@ class SimpleEmailServer:
         self.http_proxy = http_proxy
         self.https_proxy = https_proxy
         self.socks_proxy = socks_proxy
+        # Bounds every blocking SMTP operation so a dead server cannot hang the monitored program
+        self.timeout = timeout
         self.proxy_info = None
+        self._server = None
+        self._last_used = 0.0
+        self._keepalive_timer = None
+        # Serialises use of the cached session between the alert sender thread, the keepalive timer
+        # and the synchronous fallback used when the alert queue is full
+        self._lock = threading.RLock()
+        # Only the recipient, subject and body vary between emails, so the rest is rendered once here.
+        # Tracebacks are nearly always plain ASCII, which gets a 7bit variant that needs no body encoding.
+        # Other bodies go out as raw 8bit where the server offers 8BITMIME (RFC 6152), base64 otherwise.
+        self._ascii_template = self._build_template('us-ascii', '7bit')
+        self._utf8_template = self._build_template('utf-8', '8bit')
+        self._base64_template = self._build_template('utf-8', 'base64')
         try:
             if self.http_proxy:
                 self.proxy_info = self._parse_proxy(self.http_proxy, 'http')
@@ -32,64 +111,364 @@ class SimpleEmailServer:
             elif self.socks_proxy:
                 self.proxy_info = self._parse_proxy(self.socks_proxy, 'socks')
         except ValueError as e:
-            print(f"[TERMINATION_MONITOR] Proxy configuration error: {e}. Proxy disabled.")
+            _log.error("Proxy configuration error: %s. Proxy disabled.", e)
             self.proxy_info = None
 
     def _parse_proxy(self, proxy_url: str, proxy_type: str):
-        from urllib.parse import urlparse
-        parsed = urlparse(proxy_url)
-        if not parsed.hostname:
+        match = _PROXY_RE.match(proxy_url)
+        if not match:
             raise ValueError(f"Invalid proxy URL: {proxy_url}")
+        port = int(match.group(3) or 8080)
+        if not 0 < port <= 65535:
+            raise ValueError(f"Proxy port out of range 1-65535: {proxy_url}")
         return {
             'type': proxy_type,
-            'host': parsed.hostname,
-            'port': parsed.port or 8080
+            'host': match.group(1) or match.group(2),
+            'port': port
         }
 
+    def _connect(self):
+        """
+        Returns a live, authenticated SMTP session, reusing the cached one when it still answers NOOP.
+        """
+        # Imported here so a monitor without email configuration never pays for smtplib/ssl or PySocks
+        import smtplib
+        if self._server is not None:
+            try:
+                self._server.noop()
+                return self._server
+            except smtplib.SMTPServerDisconnected:
+                self._server = None
+
+        _log.info("Connecting to SMTP server %s:%s...", self.smtp_host, self.smtp_port)
+        self._server = self._open()
+        return self._server
+
+    def _open(self):
+        """
+        Opens and authenticates a new SMTP session.
+        """
+        import smtplib
+        # Establish secure connection
+        server_class = smtplib.SMTP_SSL if self.smtp_port == 465 else smtplib.SMTP
+        if self.proxy_info:
+            # Route only this session through the proxy instead of patching socket.socket process-wide
+            server = server_class(timeout=self.timeout)
+            server._host = self.smtp_host
+            server._get_socket = lambda host, port, timeout: self._open_proxy_socket(server, host, port, timeout)
+            server.connect(self.smtp_host, self.smtp_port)
+        else:
+            server = server_class(self.smtp_host, self.smtp_port, timeout=self.timeout)
+        # SMTP is a chatty small-message protocol, so do not let Nagle hold back each command
+        server.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if server_class is smtplib.SMTP:
+            server.starttls() # Upgrade to secure connection
+
+        server.login(self.sender_email, self.sender_password)
+        return server
+
+    def _open_proxy_socket(self, server, host: str, port: int, timeout: Any):
+        """
+        Stands in for smtplib.SMTP._get_socket, tunnelling the connection through the configured proxy.
+        """
+        import smtplib
+        import socks
+        if self.proxy_info['type'] == 'socks':
+            proxy_type = socks.PROXY_TYPE_SOCKS5
+        else:
+            proxy_type = socks.PROXY_TYPE_HTTP
+        sock = socks.socksocket()
+        sock.set_proxy(proxy_type, self.proxy_info['host'], self.proxy_info['port'])
+        if timeout is not socket._GLOBAL_DEFAULT_TIMEOUT:
+            sock.settimeout(timeout)
+        sock.connect((host, port))
+        if isinstance(server, smtplib.SMTP_SSL):
+            sock = server.context.wrap_socket(sock, server_hostname=host)
+        return sock
+
+    def _build_template(self, charset: str, transfer_encoding: str) -> bytes:
+        return (
+            f"From: {self.sender_email}\r\n"
+            f"To: {{TO}}\r\n"
+            f"Subject: {{SUBJ}}\r\n"
+            f"MIME-Version: 1.0\r\n"
+            f"Content-Type: text/plain; charset={charset}\r\n"
+            f"Content-Transfer-Encoding: {transfer_encoding}\r\n"
+            f"\r\n"
+            f"{{BODY}}"
+        ).encode('utf-8')
+
+    def _render(self, recipient: str, subject: str, body: str, eight_bit: bool) -> bytes:
+        if not subject.isascii():
+            from email.header import Header
+            # Long subjects are folded, and header lines must end in CRLF like the rest of the template
+            subject = Header(subject, 'utf-8').encode(linesep='\r\n')
+        body = '\r\n'.join(body.splitlines())
+        # str.isascii() is a flag check in CPython, so picking the template costs no scan of the body
+        if body.isascii():
+            template, body_bytes = self._ascii_template, body.encode('ascii')
+        elif eight_bit:
+            template, body_bytes = self._utf8_template, body.encode('utf-8')
+        else:
+            import base64
+            template = self._base64_template
+            body_bytes = base64.encodebytes(body.encode('utf-8')).replace(b'\n', b'\r\n')
+        return (template
+                .replace(b'{TO}', recipient.encode('utf-8'))
+                .replace(b'{SUBJ}', subject.encode('utf-8'))
+                .replace(b'{BODY}', body_bytes))
+
+    def _send_on(self, server, recipient: str, subject: str, body: str):
+        server.ehlo_or_helo_if_needed()
+        # The body encoding depends on what this particular server accepts, so render per session
+        eight_bit = not body.isascii() and server.has_extn('8bitmime')
+        msg = self._render(recipient, subject, body, eight_bit)
+        mail_options = ['BODY=8BITMIME'] if eight_bit else []
+        if server.does_esmtp and server.has_extn('pipelining'):
+            self._send_pipelined(server, recipient, msg, mail_options)
+        else:
+            server.sendmail(self.sender_email, recipient, msg, mail_options)
+
+    def _send_pipelined(self, server, recipient: str, msg: bytes, mail_options: list):
+        """
+        Same transaction as smtplib.SMTP.sendmail, but MAIL, RCPT and DATA go out in one write (RFC 2920).
+        """
+        import smtplib
+        server.send(
+            f"mail FROM:{smtplib.quoteaddr(self.sender_email)}{''.join(' ' + option for option in mail_options)}\r\n"
+            f"rcpt TO:{smtplib.quoteaddr(recipient)}\r\n"
+            f"data\r\n"
+        )
+        mail_code, mail_resp = server.getreply()
+        rcpt_code, rcpt_resp = server.getreply()
+        data_code, data_resp = server.getreply()
+
+        if data_code == 354 and (mail_code != 250 or rcpt_code not in (250, 251)):
+            # The server accepted DATA despite a rejected envelope, so end it empty before bailing out
+            server.send(b".\r\n")
+            server.getreply()
+            data_code = 0
+        if mail_code != 250:
+            server._rset()
+            raise smtplib.SMTPSenderRefused(mail_code, mail_resp, self.sender_email)
+        if rcpt_code not in (250, 251):
+            server._rset()
+            raise smtplib.SMTPRecipientsRefused({recipient: (rcpt_code, rcpt_resp)})
+        if data_code != 354:
+            server._rset()
+            raise smtplib.SMTPDataError(data_code, data_resp)
+
+        # Dot-stuff and terminate the message the same way smtplib.SMTP.data does
+        data = re.sub(br'(?m)^\.', b'..', msg)
+        if not data.endswith(b"\r\n"):
+            data += b"\r\n"
+        server.send(data + b".\r\n")
+        code, resp = server.getreply()
+        if code != 250:
+            server._rset()
+            raise smtplib.SMTPDataError(code, resp)
+
     def send(self, recipient: str, subject: str, body: str) -> bool:
         """
-        Connects to the SMTP server and sends the email.
+        Sends the email over the cached SMTP session, connecting (or reconnecting) when needed.
         """
-        msg = MIMEMultipart()
-        msg['From'] = self.sender_email
-        msg['To'] = recipient
-        msg['Subject'] = subject
-        msg.attach(MIMEText(body, 'plain'))
+        with self._lock:
+            return self._send_locked(recipient, subject, body)
 
+    def _send_locked(self, recipient: str, subject: str, body: str) -> bool:
+        import smtplib
         try:
-            print(f"[TERMINATION_MONITOR] Connecting to SMTP server {self.smtp_host}:{self.smtp_port}...")
-            # Set proxy if configured
-            original_socket = socket.socket
-            if self.proxy_info:
-                if self.proxy_info['type'] in ['http', 'https']:
-                    socks.setdefaultproxy(socks.PROXY_TYPE_HTTP, self.proxy_info['host'], self.proxy_info['port'])
-                elif self.proxy_info['type'] == 'socks':
-                    socks.setdefaultproxy(socks.PROXY_TYPE_SOCKS5, self.proxy_info['host'], self.proxy_info['port'])
-                socket.socket = socks.socksocket
-            # Establish secure connection
-            if self.smtp_port == 465:
-                server = smtplib.SMTP_SSL(self.smtp_host, self.smtp_port)
-            else:
-                server = smtplib.SMTP(self.smtp_host, self.smtp_port)
-                server.starttls() # Upgrade to secure connection
-
-            server.login(self.sender_email, self.sender_password)
-            server.sendmail(self.sender_email, recipient, msg.as_string())
-            server.quit()
-            print("[TERMINATION_MONITOR] Email notification sent successfully.")
+            server = self._connect()
+            try:
+                self._send_on(server, recipient, subject, body)
+            except smtplib.SMTPServerDisconnected:
+                # The session dropped between the NOOP probe and the send, so retry once on a fresh one
+                self._server = None
+                self._send_on(self._connect(), recipient, subject, body)
+            _log.info("Email notification sent successfully.")
+            self._last_used = time.monotonic()
+            self._schedule_keepalive()
             return True
         except Exception as e:
-            print(f"[TERMINATION_MONITOR] Failed to send email. Error: {e}")
+            _log.error("Failed to send email. Error: %s", e)
+            self.close()
             return False
+
+    def _schedule_keepalive(self):
+        if self._keepalive_timer is not None:
+            self._keepalive_timer.cancel()
+        # Wake up no later than the idle deadline, so the session is not kept open past _POOL_IDLE_TIMEOUT
+        remaining = _POOL_IDLE_TIMEOUT - (time.monotonic() - self._last_used)
+        self._keepalive_timer = threading.Timer(max(0.0, min(_KEEPALIVE_INTERVAL, remaining)), self._keep_alive)
+        self._keepalive_timer.daemon = True
+        self._keepalive_timer.start()
+
+    def _keep_alive(self):
+        """
+        Timer callback that keeps an idle session open for reuse, or closes it once it has been idle too long.
+        """
+        import smtplib
+        with self._lock:
+            if self._server is None:
+                return
+            if time.monotonic() - self._last_used >= _POOL_IDLE_TIMEOUT:
+                self.close()
+                return
+            try:
+                self._server.noop()
+            except (smtplib.SMTPException, OSError):
+                # Let the next send reconnect instead
+                server, self._server = self._server, None
+                server.close()
+                return
+            self._schedule_keepalive()
+
+    def close(self, graceful: bool = True):
+        """
+        Ends the cached SMTP session, if any.
+        With graceful=False the socket is just dropped instead of waiting for the server to answer QUIT.
+        """
+        with self._lock:
+            if self._keepalive_timer is not None:
+                self._keepalive_timer.cancel()
+                self._keepalive_timer = None
+            server, self._server = self._server, None
+        if server is None:
+            return
+        if not graceful:
+            server.close()
+            return
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+class _NullMailer:
+    """
+    Stands in for SimpleEmailServer when the email configuration is incomplete.
+    """
+    send = staticmethod(lambda *args, **kwargs: True)
+    close = staticmethod(lambda *args, **kwargs: None)
+
+# Mailers shared by every monitor in the process, keyed by (smtp_host, smtp_port, sender_email)
+_MAILER_POOL: Dict[Tuple[str, int, str], SimpleEmailServer] = {}
+_MAILER_POOL_LOCK = threading.Lock()
+
+def _get_mailer(smtp_host: str, smtp_port: int, sender_email: str, sender_password: str, **kwargs) -> SimpleEmailServer:
+    """
+    Fetches the pooled mailer for this account, creating (or replacing a stale) one when needed.
+    """
+    key = (smtp_host, smtp_port, sender_email)
+    settings = (sender_password, kwargs)
+    with _MAILER_POOL_LOCK:
+        stale = _MAILER_POOL.get(key)
+        if stale is not None and stale._pool_settings == settings:
+            return stale
+        mailer = SimpleEmailServer(smtp_host, smtp_port, sender_email, sender_password, **kwargs)
+        mailer._pool_settings = settings
+        _MAILER_POOL[key] = mailer
+        # Pooled sessions outlive their monitors and the pool keeps them alive, so close them at interpreter exit
+        atexit.register(mailer.close)
+        # atexit runs hooks last-in first-out; re-registering keeps the alert flush ahead of every close
+        atexit.unregister(_flush_alerts_at_exit)
+        atexit.register(_flush_alerts_at_exit)
+    if stale is not None:
+        # Credentials or proxy changed, so the old session must not be reused. Its QUIT may take up
+        # to the SMTP timeout, so it happens outside the pool lock. Alerts still queued for it will
+        # reconnect it, which is why its atexit hook stays registered.
+        stale.close()
+    return mailer
+
+def _reset_pool_after_fork():
+    """
+    Empties the mailer pool in a forked child, whose inherited sessions share their sockets with the parent.
+    """
+    global _MAILER_POOL_LOCK
+    _MAILER_POOL_LOCK = threading.Lock()
+    for mailer in _MAILER_POOL.values():
+        # The parent may have held the lock at the moment of the fork; the keepalive timer did not survive it
+        mailer._lock = threading.RLock()
+        mailer._keepalive_timer = None
+        server, mailer._server = mailer._server, None
+        if server is not None:
+            # Only drop this process's copy of the socket; QUIT would end the parent's session too
+            server.close()
+    _MAILER_POOL.clear()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_pool_after_fork)
+
+# Alerts are handed to one background sender so a slow SMTP server never stalls the monitored program
+_ALERT_QUEUE: "queue.Queue[Tuple[Any, str, str, str, bool]]" = queue.Queue(maxsize=16)
+_alert_sender: Optional[threading.Thread] = None
+_ALERT_SENDER_LOCK = threading.Lock()
+
+def _send_alerts():
+    while True:
+        mailer, recipient, subject, body, abort_after = _ALERT_QUEUE.get()
+        try:
+            _deliver_alert(mailer, recipient, subject, body, abort_after)
         finally:
-            # Restore original socket
-            socket.socket = original_socket
+            _ALERT_QUEUE.task_done()
+
+def _deliver_alert(mailer: SimpleEmailServer, recipient: str, subject: str, body: str, abort_after: bool):
+    mailer.send(recipient, subject, body)
+    if abort_after:
+        # A crashed program will not reuse the session, and the server reaps it anyway; skip the QUIT round trip
+        mailer.close(graceful=False)
+
+def _flush_alerts(timeout: float) -> bool:
+    """
+    Waits up to timeout seconds for every queued alert to be sent. Returns False if some are still pending.
+    """
+    deadline = time.monotonic() + timeout
+    with _ALERT_QUEUE.all_tasks_done:
+        while _ALERT_QUEUE.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                _log.warning("Timed out waiting for queued email notifications.")
+                return False
+            _ALERT_QUEUE.all_tasks_done.wait(remaining)
+    return True
+
+def _flush_alerts_at_exit():
+    # The sender is a daemon thread, so give queued alerts a chance to go out before the process ends
+    _flush_alerts(_EXIT_FLUSH_TIMEOUT)
+
+def _enqueue_alert(mailer: SimpleEmailServer, recipient: str, subject: str, body: str, abort_after: bool = False):
+    global _alert_sender
+    with _ALERT_SENDER_LOCK:
+        if _alert_sender is None:
+            _alert_sender = threading.Thread(target=_send_alerts, daemon=True)
+            _alert_sender.start()
+    try:
+        _ALERT_QUEUE.put_nowait((mailer, recipient, subject, body, abort_after))
+    except queue.Full:
+        _log.warning("Email notification queue is full. Sending synchronously.")
+        _deliver_alert(mailer, recipient, subject, body, abort_after)
+
+def _reset_alerts_after_fork():
+    """
+    Gives a forked child its own alert queue and sender, since threads do not survive fork().
+    The inherited queue holds the parent's alerts, which the parent sends itself.
+    """
+    global _ALERT_QUEUE, _alert_sender, _ALERT_SENDER_LOCK
+    _ALERT_QUEUE = queue.Queue(maxsize=16)
+    _alert_sender = None
+    # The parent may have held the lock at the moment of the fork
+    _ALERT_SENDER_LOCK = threading.Lock()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_alerts_after_fork)
 
 class termination_monitor:
     """
     The main monitoring class. Use it as a Context Manager (with statement).
     It captures exceptions, interrupts (Ctrl+C), and termination signals.
     """
+    # Resolved once so the signal handler does not have to build signal.Signals members
+    _SIG_NAMES = {s.value: s.name for s in signal.Signals}
+
     def __init__(self, 
                  recipient_email: Optional[str] = None, 
                  smtp_host: Optional[str] = None,
@@ -101,27 +480,34 @@ class termination_monitor:
                  socks_proxy: Optional[str] = None):
         
         # 1. Configuration Priority: Instance Argument > System Environment Variable
-        self.recipient_email = recipient_email or os.getenv('TERMINATION_MONITOR_RECIPIENT_EMAIL')
-        self.smtp_host = smtp_host or os.getenv('TERMINATION_MONITOR_SMTP_HOST', 'smtp.gmail.com')
-        self.smtp_port = int(smtp_port or os.getenv('TERMINATION_MONITOR_SMTP_PORT', 587))
-        self.sender_email = sender_email or os.getenv('TERMINATION_MONITOR_SENDER_EMAIL')
-        self.sender_password = sender_password or os.getenv('TERMINATION_MONITOR_SENDER_PASSWORD')
-        self.http_proxy = http_proxy or os.getenv('TERMINATION_MONITOR_HTTP_PROXY')
-        self.https_proxy = https_proxy or os.getenv('TERMINATION_MONITOR_HTTPS_PROXY')
-        self.socks_proxy = socks_proxy or os.getenv('TERMINATION_MONITOR_SOCKS_PROXY')
-
-        self.mailer = None
+        env = os.environ
+        self.recipient_email = recipient_email or env.get('TERMINATION_MONITOR_RECIPIENT_EMAIL')
+        self.smtp_host = smtp_host or env.get('TERMINATION_MONITOR_SMTP_HOST', 'smtp.gmail.com')
+        self.smtp_port = int(smtp_port or env.get('TERMINATION_MONITOR_SMTP_PORT', 587))
+        self.sender_email = sender_email or env.get('TERMINATION_MONITOR_SENDER_EMAIL')
+        self.sender_password = sender_password or env.get('TERMINATION_MONITOR_SENDER_PASSWORD')
+        self.http_proxy = http_proxy or env.get('TERMINATION_MONITOR_HTTP_PROXY')
+        self.https_proxy = https_proxy or env.get('TERMINATION_MONITOR_HTTPS_PROXY')
+        self.socks_proxy = socks_proxy or env.get('TERMINATION_MONITOR_SOCKS_PROXY')
+
+        self.mailer = _NullMailer()
         if self.sender_email and self.sender_password and self.recipient_email:
-            self.mailer = SimpleEmailServer(self.smtp_host, self.smtp_port, self.sender_email, self.sender_password, http_proxy=self.http_proxy, https_proxy=self.https_proxy, socks_proxy=self.socks_proxy)
+            self.mailer = _get_mailer(self.smtp_host, self.smtp_port, self.sender_email, self.sender_password, http_proxy=self.http_proxy, https_proxy=self.https_proxy, socks_proxy=self.socks_proxy)
         else:
-            print("[TERMINATION_MONITOR] Warning: Email configuration incomplete. Email alerts will be disabled.")
+            _log.warning("Email configuration incomplete. Email alerts will be disabled.")
 
         self._original_sigint = None
         self._original_sigterm = None
+        self._signal_lock = threading.Lock()
+        self._received_signal = None
+        # The hostname is fixed for the life of the process, so look it up once
+        self._hostname = socket.gethostname()
 
     def __enter__(self):
         start_time = datetime.now()
-        print(f"[TERMINATION_MONITOR] Monitoring started at {start_time}...")
+        _log.info("Monitoring started at %s...", start_time)
+        self._signal_lock = threading.Lock()
+        self._received_signal = None
         
         # Capture SIGTERM (Termination signal, like 'kill' command)
         self._original_sigterm = signal.signal(signal.SIGTERM, self._handle_signal)
@@ -129,18 +515,11 @@ class termination_monitor:
         self._original_sigint = signal.signal(signal.SIGINT, self._handle_signal)
         
         # Send "Activated" Email ---
-        if self.mailer:
-            hostname = socket.gethostname()
+        if not isinstance(self.mailer, _NullMailer):
             subject = "[INFO] Monitoring Activated: Your Program Started"
-            body = (
-                f"Program monitoring has started successfully.\n\n"
-                f"Host Machine: {hostname}\n"
-                f"Start Time: {start_time}\n"
-                f"----------------------------------------\n"
-                f"You will receive another email when the program terminates (success or failure).\n"
-            )
-            print("[TERMINATION_MONITOR] Sending start-up notification...")
-            self.mailer.send(self.recipient_email, subject, body)
+            body = _STARTUP_TEMPLATE.format_map({'hostname': self._hostname, 'start_time': start_time})
+            _log.info("Sending start-up notification...")
+            _enqueue_alert(self.mailer, self.recipient_email, subject, body)
         # --------------------------------------------
 
         return self
@@ -157,19 +536,32 @@ class termination_monitor:
         signal.signal(signal.SIGTERM, self._original_sigterm)
         signal.signal(signal.SIGINT, self._original_sigint)
 
+        if self._received_signal is not None:
+            # Logged here rather than in the handler, where going through logging is not safe
+            _log.warning("Signal received: %s", self._received_signal)
+
         # Check if an exception occurred
         if exc_type:
             status = "Crashed / Terminated"
-            # Format the traceback
-            error_details = "".join(traceback.format_exception(exc_type, exc_value, tb))
-            print(f"\n[TERMINATION_MONITOR] Exception detected:\n{error_details}")
+            # The header and traceback go out as one record, so nothing logged meanwhile lands in between
+            if isinstance(self.mailer, _NullMailer):
+                # Nothing to email, so leave the traceback to the handler, which formats it only if it emits
+                _log.error("Exception detected:", exc_info=(exc_type, exc_value, tb))
+            else:
+                # Format once and reuse the text for both the log and the report
+                error_details = "".join(traceback.format_exception(exc_type, exc_value, tb))
+                _log.error("Exception detected:\n%s", error_details.rstrip("\n"))
             
             # If it is a KeyboardInterrupt or our custom Signal Exit, handle gracefully
             if exc_type is KeyboardInterrupt:
                 status = "Interrupted by User (Ctrl+C)"
                 error_details = "User manually stopped the program."
 
+        # The session stays open in the mailer pool for the next monitor using the same account
         self._trigger_alert(status, error_details, end_time)
+        if exc_type:
+            # Give the report a moment to leave; delivery carries on in the background if this runs out
+            _flush_alerts(_CRASH_FLUSH_TIMEOUT)
         
         # Return False to propagate the exception (so the program actually crashes/stops), 
         # or True to suppress it. We propagate it.
@@ -179,32 +571,31 @@ class termination_monitor:
         """
         Custom signal handler to translate system signals into Python exceptions 
         so __exit__ can catch them.
+        Python already runs this in the main thread at a bytecode boundary, so raising here is safe.
+        Only the first signal is translated; later ones get the default disposition.
         """
-        sig_name = signal.Signals(signum).name
-        print(f"\n[TERMINATION_MONITOR] Signal received: {sig_name}")
+        # Hand later signals to the default disposition straight away, before anything else can run
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        if not self._signal_lock.acquire(blocking=False):
+            return
+        sig_name = self._SIG_NAMES.get(signum, str(signum))
+        # Reported from __exit__, so the notice goes through the host application's logging setup
+        self._received_signal = sig_name
         # Raising SystemExit ensures __exit__ is called
         sys.exit(f"Process terminated by signal {sig_name}")
 
     def _trigger_alert(self, status: str, details: str, time: datetime):
-        if not self.mailer:
-            print("[TERMINATION_MONITOR] No email configuration. Skipping alert.")
+        # Checked before any report formatting so disabled email costs nothing here
+        if isinstance(self.mailer, _NullMailer):
+            _log.info("No email configuration. Skipping alert.")
             return
 
-        print("[TERMINATION_MONITOR] Preparing termination report...")
+        _log.info("Preparing termination report...")
         
-        hostname = socket.gethostname()
         subject = f"[ALERT] Your Program is Terminated: {status}"
         
-        body = (
-            f"Your program monitoring report:\n\n"
-            f"Host Machine: {hostname}\n"
-            f"Status: {status}\n"
-            f"Time: {time}\n"
-            f"----------------------------------------\n"
-            f"Error Logs / Traceback:\n"
-            f"{details}\n"
-            f"----------------------------------------\n"
-            f"This is an automated message from Your_Program_is_Terminated library."
-        )
+        body = _REPORT_TEMPLATE.format_map({'hostname': self._hostname, 'status': status, 'time': time, 'details': details})
 
-        self.mailer.send(self.recipient_email, subject, body)
+        # Queued behind the start-up email, so the two still go out in order over the same session
+        _enqueue_alert(self.mailer, self.recipient_email, subject, body, abort_after=status != "Success")